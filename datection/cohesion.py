@@ -13,7 +13,7 @@ from copy import deepcopy
 
 from dateutil.rrule import WEEKLY
 from dateutil.rrule import DAILY
-from dateutil.rrule import rrule
+from datection.rrule_backend import rrule
 from dateutil.rrule import MO, TU, WE, TH, FR, SA, SU
 
 from datection.timepoint import ALL_DAY
@@ -16,6 +16,10 @@ it makes sense to use it only when necessary.
 from builtins import str
 from builtins import range
 from builtins import object
+
+from datection.grammar import grammar_module
+
+
 class Context(object):
 
     """ An object representing the textual context around a temporal reference
@@ -102,8 +106,7 @@ def probe(text, lang):
 
     """
     matches = []
-    probes = __import__(
-        'datection.grammar.' + lang, fromlist=['grammar']).PROBES
+    probes = grammar_module(lang).PROBES
     for tp_probe in probes:
         for match, start, end in tp_probe.scanString(text):
             matches.append(Context(start, end, text, list(match.keys())))
@@ -7,7 +7,7 @@ from another one.
 """
 
 from builtins import object
-from dateutil.rrule import rrulestr
+from datection.rrule_backend import rrulestr
 
 from datection.utils import makerrulestr
 from datection.utils import stringify_rrule
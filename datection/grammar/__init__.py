@@ -9,6 +9,7 @@ import re
 
 from dateutil.rrule import weekdays
 from dateutil.rrule import weekday
+from functools import lru_cache
 from pyparsing import Regex
 from pyparsing import Optional
 
@@ -26,6 +27,16 @@ from datection.timepoint import WeeklyRecurrence
 from datection.timepoint import Weekdays
 
 
+@lru_cache(maxsize=None)
+def grammar_module(lang):
+    """Return the grammar module of the argument language.
+
+    The module is only looked up once per language.
+
+    """
+    return __import__('datection.grammar.%s' % (lang), fromlist=['grammar'])
+
+
 def optional_ci(s):
     """Return a Regex object matching the argument string case-insensitively."""
     return Optional(Regex(s, flags=re.I))
@@ -316,8 +327,9 @@ DAY_NUMBER = Regex(
     setParseAction(as_int).\
     setResultsName('day')
 
-# The year number. A valid year must either start with 1 or 2.
-YEAR = Regex(r'[12]\d{3}').\
+# The year number. A valid year must either start with 1 or 2, and must
+# not be part of a longer number.
+YEAR = Regex(r'(?<!\d)[12]\d{3}(?!\d)').\
     setParseAction(as_int).\
     setResultsName('year')
 
@@ -13,9 +13,9 @@ from datetime import timedelta
 from datetime import datetime
 from datetime import time
 from datetime import date
-from dateutil.rrule import rrulestr
-from dateutil.rrule import rruleset
-from dateutil.rrule import rrule
+from datection.rrule_backend import rrulestr
+from datection.rrule_backend import rruleset
+from datection.rrule_backend import rrule
 from dateutil.rrule import FREQNAMES
 
 from datection.utils import cached_property
@@ -246,7 +246,7 @@ class DurationRRule(object):
         Removes the exclusion rrules
         """
         self.duration_rrule.pop('excluded', None)
-        self._exclusion_rrules = []
+        self.exclusion_rrules = []
 
     def add_exclusion_rrule(self, ex_rrule):
         """
@@ -258,9 +258,9 @@ class DurationRRule(object):
             self.duration_rrule['excluded'] = []
         self.duration_rrule['excluded'].append(ex_rrule_str)
 
-        if not hasattr(self, '_exclusion_rrules'):
-            self._exclusion_rrules = []
-        self._exclusion_rrules.append(ex_rrule)
+        if 'exclusion_rrules' not in self.__dict__:
+            self.exclusion_rrules = []
+        self.exclusion_rrules.append(ex_rrule)
 
     @cached_property
     def rrule(self):
@@ -424,16 +424,19 @@ class DurationRRule(object):
 
     @property
     def is_recurring(self):
-        if not 'BYDAY' in self.duration_rrule['rrule']:
+        rrule_str = self.duration_rrule['rrule']
+        if not 'BYDAY' in rrule_str:
+            return False
+        # the cheap string test is performed before looking at the rrule
+        if 'COUNT=1' in rrule_str:
             return False
-        if ((self.rrule._byweekday is not None) and len(self.rrule._byweekday) == 7 and
+        byweekday = self.rrule._byweekday
+        if ((byweekday is not None) and len(byweekday) == 7 and
             not self.is_all_year_recurrence):
             # if a rrule says "every day from DT_START to DT_END", it is
             # similar to "from DT_START to DT_END", hence it is not a
             # recurrence!
             return False
-        if 'COUNT=1' in self.duration_rrule['rrule']:
-            return False
         return True
 
     @property
@@ -448,7 +451,10 @@ class DurationRRule(object):
     def is_all_year_recurrence(self):
         if not 'BYDAY' in self.duration_rrule['rrule']:
             return False
-        return self.rrule._dtstart + timedelta(days=365) == self.rrule._until
+        rule = self.rrule
+        if rule._until is None:
+            return False
+        return rule._dtstart + timedelta(days=365) == rule._until
 
     # Properties describing the RRule typology
 
@@ -2,6 +2,9 @@
 import re
 from functools import wraps
 
+# the lazy property decorator is shared with the rest of the package
+from datection.utils import cached_property  # noqa
+
 
 def postprocess(strip=True, trim_whitespaces=True, lstrip_pattern=None,
                 capitalize=False, rstrip_pattern=None):
@@ -24,15 +27,3 @@ def postprocess(strip=True, trim_whitespaces=True, lstrip_pattern=None,
             return text
         return wrapper
     return wrapped_f
-
-
-def cached_property(f):
-    """Lazy loading decorator for object properties"""
-    attr_name = '_' + f.__name__
-
-    @property
-    def wrapper(self):
-        if not hasattr(self, attr_name):
-            setattr(self, attr_name, f(self))
-        return getattr(self, attr_name)
-    return wrapper
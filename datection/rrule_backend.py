@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+"""
+Selection of the rrule implementation used by datection.
+
+The python-dateutil implementation is used by default. A faster, API
+compatible implementation can be selected by setting the
+DATECTION_RRULE_BACKEND environment variable to 'rust', in which case the
+dateutil_rs package is used when it is installed. Unsetting the variable
+rolls back to python-dateutil, and so does any unknown value.
+
+"""
+
+import os
+
+RRULE_BACKENDS = ('dateutil', 'rust')
+
+RRULE_BACKEND = os.environ.get('DATECTION_RRULE_BACKEND', 'dateutil')
+if RRULE_BACKEND not in RRULE_BACKENDS:
+    RRULE_BACKEND = 'dateutil'
+
+if RRULE_BACKEND == 'rust':
+    try:
+        from dateutil_rs.rrule import rrule
+        from dateutil_rs.rrule import rruleset
+        from dateutil_rs.rrule import rrulestr
+    except ImportError:
+        RRULE_BACKEND = 'dateutil'
+
+if RRULE_BACKEND != 'rust':
+    from dateutil.rrule import rrule
+    from dateutil.rrule import rruleset
+    from dateutil.rrule import rrulestr
@@ -92,6 +92,17 @@ class TestLanguageAgnosticRegexes(TestGrammar):
         self.assert_parse(u'2000')
         self.assert_parse(u'2999')
 
+    @set_pattern(YEAR)
+    def test_search_year_in_digits(self):
+        # a year must not be matched inside a longer number
+        self.assertEqual(list(self.pattern.scanString(u'ref 92015')), [])
+        self.assertEqual(list(self.pattern.scanString(u'ref 20151234')), [])
+        matches = [
+            (result[0], start, end)
+            for result, start, end in self.pattern.scanString(
+                u'ref 32015, 20151, le 12 mars 2015')]
+        self.assertEqual(matches, [(2015, 29, 33)])
+
     @set_pattern(DAY_NUMBER)
     def test_unparsable_year(self):
         self.assert_unparsable(u'999')
@@ -397,6 +397,18 @@ class TestParse(unittest.TestCase):
             u"Le 08/11/2017 : Merc. de 20:30 à 23:00",
             [datetime(2017, 11, 8, 20, 30)])
 
+    def test_datetime_with_identical_spans(self):
+        # the datetime and the datetime list of the last date have the same
+        # span, which does not count as an intersection: the datetime is
+        # kept, as the most complex pattern
+        text = (u"Du mercredi 5 au dimanche 9 mars 2014 à 9 h\n"
+                u"Le mercredi 26 février 2014, le jeudi 26 février 2015, à 9 h")
+        dts = [tp for tp in parse(text, "fr") if isinstance(tp, Datetime)]
+        self.assertEqual(len(dts), 1)
+        self.assertEqual(
+            dts[0].export()['rrule'],
+            'DTSTART:20150226\nRRULE:FREQ=DAILY;BYHOUR=9;BYMINUTE=0;COUNT=1')
+
     def test_expression_morning(self):
         dt = [tp for tp in parse(u"Le 5 mars 2015, le matin", "fr")
               if isinstance(tp, Datetime)][0]
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+"""Test suite of the datection.rrule_backend module."""
+
+import os
+import unittest
+
+from importlib import reload
+
+import dateutil.rrule
+
+from datection import rrule_backend
+
+
+class TestRRuleBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.env_backend = os.environ.pop('DATECTION_RRULE_BACKEND', None)
+
+    def tearDown(self):
+        if self.env_backend is None:
+            os.environ.pop('DATECTION_RRULE_BACKEND', None)
+        else:
+            os.environ['DATECTION_RRULE_BACKEND'] = self.env_backend
+        reload(rrule_backend)
+
+    def assertDateutilBackend(self, backend):
+        self.assertEqual(backend.RRULE_BACKEND, 'dateutil')
+        self.assertIs(backend.rrule, dateutil.rrule.rrule)
+        self.assertIs(backend.rruleset, dateutil.rrule.rruleset)
+        self.assertIs(backend.rrulestr, dateutil.rrule.rrulestr)
+
+    def test_default_backend(self):
+        self.assertDateutilBackend(reload(rrule_backend))
+        rule = rrule_backend.rrulestr(
+            'DTSTART:20140405\nRRULE:FREQ=DAILY;COUNT=1')
+        self.assertIsInstance(rule, dateutil.rrule.rrule)
+
+    def test_unknown_backend(self):
+        os.environ['DATECTION_RRULE_BACKEND'] = 'unknown'
+        self.assertDateutilBackend(reload(rrule_backend))
+
+    def test_missing_rust_backend(self):
+        try:
+            import dateutil_rs  # noqa
+        except ImportError:
+            pass
+        else:
+            self.skipTest('dateutil_rs is installed')
+        os.environ['DATECTION_RRULE_BACKEND'] = 'rust'
+        self.assertDateutilBackend(reload(rrule_backend))
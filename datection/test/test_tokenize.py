@@ -98,20 +98,21 @@ class TestTokenizer(unittest.TestCase):
     def setUp(self):
         self.tok = Tokenizer(u"Du 5 au 29 mars 2015, sauf les lundis", "fr")
 
-    def test_remove_subsets(self):
-        class Span(object):
+    class Span(object):
 
-            def __init__(self, span):
-                self._span = span
+        def __init__(self, span):
+            self._span = span
 
-            @property
-            def span(self):
-                return self._span
+        @property
+        def span(self):
+            return self._span
 
-            @property
-            def start_index(self):
-                return self.span[0]
+        @property
+        def start_index(self):
+            return self.span[0]
 
+    def test_remove_subsets(self):
+        Span = self.Span
         matches = [
             (Span((0, 10)), 'CONTEXT'),
             (Span((13, 18)), 'CONTEXT'),
@@ -121,6 +122,19 @@ class TestTokenizer(unittest.TestCase):
         expected = matches[2:]
         self.assertEqual(Tokenizer._remove_subsets(matches), expected)
 
+    def test_remove_subsets_nested_and_overlapping(self):
+        Span = self.Span
+        matches = [
+            (Span((0, 4)), 'CONTEXT'),
+            (Span((1, 2)), 'CONTEXT'),  # contained into (0, 4)
+            (Span((0, 4)), 'CONTEXT'),  # same span as the first match
+            (Span((1, 6)), 'CONTEXT'),  # intersects both (0, 4) spans
+        ]
+        # the identical spans do not intersect each other, and are kept,
+        # whereas the (1, 6) span intersects 2 other spans, and is removed
+        expected = [matches[0], matches[2]]
+        self.assertEqual(Tokenizer._remove_subsets(matches), expected)
+
     def test_is_separator(self):
         self.assertTrue(Tokenizer.is_separator(u' le '))
         self.assertTrue(Tokenizer.is_separator(u', '))
@@ -193,6 +207,20 @@ class TestTokenizer(unittest.TestCase):
             token_groups[0][2],
             (u"les lundis", "MATCH", "weekly_rec"))
 
+    def test_tokenize_expressions_order(self):
+        # the replacement expressions are applied in order, whatever the
+        # case of the text: 'midi' is replaced before "l'après-midi" is
+        # matched
+        tok = Tokenizer(u"DU 1ER AU 30 JUIN 2015 L'APRÈS-MIDI", "fr")
+        token_groups = tok.tokenize()
+        self.assertEqual(len(token_groups), 2)
+        self.assertTokenEquals(
+            token_groups[0][0],
+            (u"DU 1ER AU 30 JUIN 2015", "MATCH", "date_interval"))
+        self.assertEqual(token_groups[1][0].tag, "time_pattern")
+        self.assertEqual(
+            six.text_type(token_groups[1][0].timepoint), u"12:00 - 12:00")
+
     def test_tokenize_no_context(self):
         self.tok.text = u"BLAH BLAH BLAH"
         self.assertEqual(self.tok.tokenize(), [])
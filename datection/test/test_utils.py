@@ -12,6 +12,10 @@ from datection.models import DurationRRule
 from datection.utils import isoformat_concat
 from datection.utils import normalize_2digit_year
 from datection.utils import duration
+from datection.utils import datetime_duration
+from datection.utils import time_duration
+from datection.utils import DURATION_FUNCTIONS
+from datection.utils import digit_to_int
 from datection.utils import group_facebook_hours
 from datection.utils import sort_facebook_hours
 from datection.utils import normalize_fb_hours
@@ -96,6 +100,79 @@ class UtilsTest(unittest.TestCase):
         end_datetime = datetime(2013, 8, 6, 18, 0)
         self.assertEqual(duration(start_datetime, end_datetime), 2760)
 
+    def test_time_duration(self):
+        self.assertEqual(time_duration(time(20, 0), time(21, 30)), 90)
+
+    def test_time_duration_same_time(self):
+        self.assertEqual(time_duration(time(20, 0), time(20, 0)), 0)
+
+    def test_time_duration_over_midnight(self):
+        # the end time is on the next day
+        self.assertEqual(time_duration(time(23, 0), time(1, 30)), 150)
+
+    def test_time_duration_seconds(self):
+        # the remaining seconds are not counted
+        self.assertEqual(time_duration(time(20, 0, 30), time(20, 2)), 1)
+        self.assertEqual(
+            time_duration(time(20, 0, 0, 1), time(20, 1)), 0)
+
+    def test_datetime_duration(self):
+        start_datetime = datetime(2013, 8, 4, 20, 0)
+        end_datetime = datetime(2013, 8, 6, 18, 0)
+        self.assertEqual(datetime_duration(start_datetime, end_datetime), 2760)
+
+    def test_datetime_duration_same_datetime(self):
+        start_datetime = datetime(2013, 8, 4, 20, 0)
+        self.assertEqual(datetime_duration(start_datetime, start_datetime), 0)
+
+    def test_datetime_duration_over_midnight(self):
+        start_datetime = datetime(2013, 8, 4, 23, 0)
+        end_datetime = datetime(2013, 8, 5, 1, 30)
+        self.assertEqual(datetime_duration(start_datetime, end_datetime), 150)
+
+    def test_datetime_duration_negative(self):
+        # negative durations are truncated towards zero
+        start_datetime = datetime(2013, 8, 4, 20, 0, 30)
+        end_datetime = datetime(2013, 8, 4, 20, 0)
+        self.assertEqual(datetime_duration(start_datetime, end_datetime), 0)
+
+    def test_duration_functions(self):
+        self.assertIs(DURATION_FUNCTIONS[(time, time)], time_duration)
+        self.assertIs(
+            DURATION_FUNCTIONS[(datetime, datetime)], datetime_duration)
+        self.assertEqual(duration(time(23, 0), time(1, 30)), 150)
+
+    def test_digit_to_int(self):
+        kwargs = {
+            'day': '12',
+            'month': '03',
+            # any string accepted by int() is converted
+            'negative': '-3',
+            'signed': '+4',
+            'padded': ' 12 ',
+            # other values are left untouched
+            'word': 'mars',
+            'float': '1.5',
+            'superscript': u'²',
+            'empty': '',
+            'none': None,
+            'number': 1.5,
+        }
+        expected = {
+            'day': 12,
+            'month': 3,
+            'negative': -3,
+            'signed': 4,
+            'padded': 12,
+            'word': 'mars',
+            'float': '1.5',
+            'superscript': u'²',
+            'empty': '',
+            'none': None,
+            'number': 1.5,
+        }
+        self.assertEqual(digit_to_int(kwargs), expected)
+
 
 class TestFacebookScheduleNormalization(unittest.TestCase):
 
@@ -155,6 +232,45 @@ class TestFacebookScheduleNormalization(unittest.TestCase):
         ]
         self.assertEqual(sort_facebook_hours(fb_hours), expected)
 
+    def test_sort_facebook_hours_multidigit_window(self):
+        fb_hours = {
+            "mon_10_open": "20:00",
+            "mon_10_close": "22:00",
+            "mon_2_open": "14:00",
+            "mon_2_close": "18:00",
+        }
+        expected = [
+            ("mon_2_open", "14:00"), ("mon_2_close", "18:00"),
+            ("mon_10_open", "20:00"), ("mon_10_close", "22:00"),
+        ]
+        fb_hours = sort_facebook_hours(fb_hours)
+        self.assertEqual(fb_hours, expected)
+
+        expected = [
+            [("mon_2_open", "14:00"), ("mon_2_close", "18:00")],
+            [("mon_10_open", "20:00"), ("mon_10_close", "22:00")],
+        ]
+        self.assertEqual(group_facebook_hours(fb_hours), expected)
+
+    def test_normalize_fb_hours_multidigit_window(self):
+        fb_hours = {
+            "mon_10_open": "20:00",
+            "mon_10_close": "22:00",
+            "mon_2_open": "14:00",
+            "mon_2_close": "18:00",
+        }
+        expected = [
+            WeeklyRecurrence(
+                date_interval=DateInterval.make_undefined(),
+                time_interval=TimeInterval(Time(14, 0), Time(18, 0)),
+                weekdays=Weekdays([MO])).export(),
+            WeeklyRecurrence(
+                date_interval=DateInterval.make_undefined(),
+                time_interval=TimeInterval(Time(20, 0), Time(22, 0)),
+                weekdays=Weekdays([MO])).export(),
+        ]
+        self.assertEqual(normalize_fb_hours(fb_hours), expected)
+
     def test_group_facebook_hour(self):
         expected = [
             [("mon_1_open", "10:00"), ("mon_1_close", "12:00")],
@@ -2,6 +2,7 @@
 
 """Test suite of the year transmission process."""
 
+import mock
 import unittest
 
 from datetime import date
@@ -80,6 +81,17 @@ class TestYearTransmission(unittest.TestCase):
                 Datetime(Date(2014, 5, 12), Time(8, 0), Time(18, 0)),
             ])
 
+    def test_transmit_without_yearless_date(self):
+        # the candidates are not indexed when no date can inherit a year
+        timepoints = [
+            DateInterval(Date(2015, 1, 1), Date(2040, 12, 31)),
+            Date(2015, 3, 5),
+        ]
+        yt = YearTransmitter(timepoints)
+        with mock.patch.object(yt, 'candidate_index') as candidate_index:
+            self.assertEqual(yt.transmit(), timepoints)
+        self.assertFalse(candidate_index.called)
+
     def test_transmit_year_to_unbounded_weekly(self):
         reference = date(2018, 4, 1)
         timepoints = [WeeklyRecurrence.make_undefined(TimeInterval.make_all_day())]
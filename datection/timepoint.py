@@ -9,12 +9,13 @@ from datetime import timedelta
 from datetime import datetime
 from datetime import time
 from datetime import date
-from dateutil.rrule import rrule
-from dateutil.rrule import rruleset
+from datection.rrule_backend import rrule
+from datection.rrule_backend import rruleset
 from dateutil.rrule import WEEKLY
 from dateutil.rrule import MO, TU, WE, TH, FR, SA, SU
 from operator import attrgetter
 from copy import deepcopy
+from functools import lru_cache
 
 from datection.utils import get_current_date
 from datection.utils import makerrulestr
@@ -28,12 +29,34 @@ DAY_START = time(0, 0)
 DAY_END = time(23, 59, 59)
 MIN_YEAR = 1970
 ORDERED_DAYS = [MO, TU, WE, TH, FR, SA, SU]
+ALL_WEEK_MASK = 0b1111111
 
 
 class NormalizationError(Exception):
     pass
 
 
+@lru_cache(maxsize=4096)
+def cached_date(year, month, day):
+    """Return the datetime.date defined by the arguments, or None if they
+    do not define a valid date.
+
+    The same (year, month, day) triplets occur many times when
+    normalizing a text, so the results are memoized.
+
+    """
+    try:
+        return date(year=year, month=month, day=day)
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def cached_time(hour, minute):
+    """Return the datetime.time defined by the arguments (memoized)."""
+    return time(hour, minute)
+
+
 def add_span(f):
     """Add the instance span attribute to the export if the instance
     as a 'span' attribute.
@@ -219,6 +242,13 @@ class Timepoint(object):
 
     """Base class of all timepoint classes."""
 
+    # the span is only set on the timepoints exported from a text
+    __slots__ = ('span',)
+
+    # names of the attributes compared to decide if two timepoints of the
+    # same class are equal
+    _cmp_attrs = ()
+
     def __ne__(self, other):
         return not self == other
 
@@ -227,10 +257,13 @@ class Timepoint(object):
         if not other:
             return False
         # end of hack
-        if not isinstance(other, Timepoint):
-            return False
+        if other is self:
+            return True
         if type(self) is not type(other):
             return False
+        for attr in self._cmp_attrs:
+            if getattr(self, attr) != getattr(other, attr):
+                return False
         return True
 
     def __hash__(self):
@@ -250,13 +283,13 @@ class AbstractDateInterval(Timepoint):
     interval.
 
     """
-    pass
+    __slots__ = ()
 
 
 class AbstractDate(Timepoint):
 
     """Abstract base class of all Timepoint describing a single date."""
-    pass
+    __slots__ = ()
 
 
 class Date(AbstractDate):
@@ -266,20 +299,15 @@ class Date(AbstractDate):
 
     """
 
+    __slots__ = ('year', 'month', 'day', 'allow_missing_year')
+    _cmp_attrs = ('year', 'month', 'day')
+
     def __init__(self, year, month, day):
         self.year = year
         self.month = month
         self.day = day
         self.allow_missing_year = True
 
-    def __eq__(self, other):
-        if not super(Date, self).__eq__(other):
-            return False
-        return (
-            self.year == other.year
-            and self.month == other.month
-            and self.day == other.day)
-
     def __hash__(self):
         return hash((self.year, self.month, self.day))
 
@@ -318,16 +346,11 @@ class Date(AbstractDate):
 
     def to_python(self):
         """Convert a Date object to a datetime.object"""
-        try:
-            return date(year=self.year, month=self.month, day=self.day)
-        except (TypeError, ValueError):
-            if self.allow_missing_year:
-                # Try again with the minimum year possible
-                try:
-                    return date(year=MIN_YEAR, month=self.month, day=self.day)
-                except (TypeError, ValueError):
-                    # Eg: either the month or the day is None or out of bounds
-                    return None
+        py_date = cached_date(self.year, self.month, self.day)
+        if py_date is None and self.allow_missing_year:
+            # Try again with the minimum year possible
+            py_date = cached_date(MIN_YEAR, self.month, self.day)
+        return py_date
 
     def day_of_week(self):
         """
@@ -363,6 +386,9 @@ class Time(Timepoint):
 
     """
 
+    __slots__ = ('hour', 'minute')
+    _cmp_attrs = ('hour', 'minute')
+
     def __init__(self, hour, minute):
         self.hour = hour
         self.minute = minute
@@ -373,11 +399,6 @@ class Time(Timepoint):
             self.hour,
             str(self.minute).zfill(2))
 
-    def __eq__(self, other):
-        if not super(Time, self).__eq__(other):
-            return False
-        return (self.hour == other.hour and self.minute == other.minute)
-
     def __lt__(self, other):
         return self.to_python < other.to_python()
 
@@ -394,11 +415,14 @@ class Time(Timepoint):
             return True
 
     def to_python(self):
-        return time(self.hour, self.minute)
+        return cached_time(self.hour, self.minute)
 
 
 class TimeInterval(Timepoint):
 
+    __slots__ = ('start_time', 'end_time')
+    _cmp_attrs = ('start_time', 'end_time')
+
     def __init__(self, start_time, end_time):
         self.start_time = start_time
         self.end_time = end_time
@@ -414,13 +438,6 @@ class TimeInterval(Timepoint):
             self.end_time.hour,
             str(self.end_time.minute).zfill(2))
 
-    def __eq__(self, other):
-        if not super(TimeInterval, self).__eq__(other):
-            return False
-        return (
-            self.start_time == other.start_time and
-            self.end_time == other.end_time)
-
     def __lt__(self, other):
         return self.start_time < other.start_time
 
@@ -448,6 +465,9 @@ class DateList(Timepoint):
     year = YearDescriptor()
     allow_missing_year = AllowMissingYearDescriptor(True)
 
+    __slots__ = ('dates',)
+    _cmp_attrs = ('dates',)
+
     def __init__(self, dates):
         self.dates = dates
 
@@ -455,11 +475,6 @@ class DateList(Timepoint):
         for _date in self.dates:
             yield _date
 
-    def __eq__(self, other):
-        if not super(DateList, self).__eq__(other):
-            return False
-        return self.dates == other.dates
-
     def __lt__(self, other):
         return min(self.dates) < min(other.dates)
 
@@ -472,31 +487,28 @@ class DateList(Timepoint):
     @classmethod
     def from_match(cls, dates):
         """Return a DateList instance constructed from a regex match result."""
-        dates = cls.set_months(dates)
-        dates = cls.set_years(dates)
+        dates = cls.inherit_from_last_date(dates)
         return DateList(dates)
 
     @staticmethod
-    def set_years(dates):
-        """Make all dates without year inherit from the last date year."""
-        last_date = dates[-1]
-        for _date in dates[:-1]:
-            if not _date.year:
-                if _date.month > last_date.month:
-                    _date.year = last_date.year - 1
-                else:
-                    _date.year = last_date.year
-        return dates
+    def inherit_from_last_date(dates):
+        """Make all dates without month or year inherit from the last date
+        month and year, in a single pass over the dates.
 
-    @staticmethod
-    def set_months(dates):
-        """Make all dates without month inherit from the last date month."""
+        """
         last_date = dates[-1]
-        if not last_date.month:
+        last_month, last_year = last_date.month, last_date.year
+        if not last_month:
             raise NormalizationError('Last date must have a non nil month.')
-        for _date in dates[:-1]:
+        for i in range(len(dates) - 1):
+            _date = dates[i]
             if not _date.month:
-                _date.month = last_date.month
+                _date.month = last_month
+            if not _date.year:
+                if _date.month > last_month:
+                    _date.year = last_year - 1
+                else:
+                    _date.year = last_year
         return dates
 
     @property
@@ -553,18 +565,14 @@ class DateInterval(AbstractDateInterval):
     year = YearDescriptor()
     allow_missing_year = AllowMissingYearDescriptor(True)
 
+    __slots__ = ('start_date', 'end_date', 'excluded')
+    _cmp_attrs = ('start_date', 'end_date')
+
     def __init__(self, start_date, end_date):
         self.start_date = start_date
         self.end_date = end_date
         self.excluded = []
 
-    def __eq__(self, other):
-        if not super(DateInterval, self).__eq__(other):
-            return False
-        return (
-            self.start_date == other.start_date
-            and self.end_date == other.end_date)
-
     def __lt__(self, other):
         return self.start_date < other.start_date
 
@@ -572,10 +580,9 @@ class DateInterval(AbstractDateInterval):
         return hash((self.start_date, self.end_date))
 
     def __iter__(self):
-        current = self.start_date.to_python()
-        while current <= self.end_date.to_python():
-            yield current
-            current += timedelta(days=1)
+        start, end = self.ordinal_bounds()
+        for ordinal in range(start, end + 1):
+            yield date.fromordinal(ordinal)
 
     def __repr__(self):
         return u'%s - %s%s' % (
@@ -651,8 +658,18 @@ class DateInterval(AbstractDateInterval):
         """ Date range length """
         return (self.end_date.to_python() - self.start_date.to_python())
 
+    def ordinal_bounds(self):
+        """Return the proleptic Gregorian ordinals of the start and end
+        dates.
+
+        """
+        return (
+            self.start_date.to_python().toordinal(),
+            self.end_date.to_python().toordinal())
+
     def to_python(self):
-        return [_date for _date in self]
+        start, end = self.ordinal_bounds()
+        return [date.fromordinal(ordinal) for ordinal in range(start, end + 1)]
 
     @add_span
     def export(self):
@@ -692,6 +709,9 @@ class Datetime(AbstractDate):
     year = YearDescriptor()
     allow_missing_year = AllowMissingYearDescriptor(True)
 
+    __slots__ = ('date', 'start_time', 'end_time')
+    _cmp_attrs = ('date', 'start_time', 'end_time')
+
     def __init__(self, date, start_time, end_time=None):
         self.date = date
         self.start_time = start_time
@@ -700,14 +720,6 @@ class Datetime(AbstractDate):
         else:
             self.end_time = end_time
 
-    def __eq__(self, other):
-        if not super(Datetime, self).__eq__(other):
-            return False
-        return (
-            self.date == other.date
-            and self.start_time == other.start_time
-            and self.end_time == other.end_time)
-
     def __lt__(self, other):
         return self.to_python() < other.to_python()
 
@@ -815,14 +827,12 @@ class DatetimeList(Timepoint):
     year = YearDescriptor()
     allow_missing_year = AllowMissingYearDescriptor(True)
 
+    __slots__ = ('datetimes',)
+    _cmp_attrs = ('datetimes',)
+
     def __init__(self, datetimes, *args, **kwargs):
         self.datetimes = datetimes
 
-    def __eq__(self, other):
-        if not super(DatetimeList, self).__eq__(other):
-            return False
-        return self.datetimes == other.datetimes
-
     def __lt__(self, other):
         return min(self.datetimes) < min(other.datetimes)
 
@@ -883,18 +893,14 @@ class DatetimeInterval(AbstractDateInterval):
     year = YearDescriptor()
     allow_missing_year = AllowMissingYearDescriptor(True)
 
+    __slots__ = ('date_interval', 'time_interval', 'excluded')
+    _cmp_attrs = ('date_interval', 'time_interval')
+
     def __init__(self, date_interval, time_interval):
         self.date_interval = date_interval
         self.time_interval = time_interval
         self.excluded = []
 
-    def __eq__(self, other):
-        if not super(DatetimeInterval, self).__eq__(other):
-            return False
-        return (
-            self.date_interval == other.date_interval
-            and self.time_interval == other.time_interval)
-
     def __lt__(self, other):
         if self.date_interval < other.date_interval:
             return True
@@ -917,10 +923,7 @@ class DatetimeInterval(AbstractDateInterval):
         )
 
     def __iter__(self):
-        current = self.date_interval.start_date.to_python()
-        while current <= self.date_interval.end_date.to_python():
-            yield current
-            current += timedelta(days=1)
+        return iter(self.date_interval)
 
     def set_time_interval(self, time_interval):
         """ Sets the time interval """
@@ -981,7 +984,7 @@ class DatetimeInterval(AbstractDateInterval):
         return self.date_interval.end_date.future(reference)
 
     def to_python(self):
-        return [_date for _date in self]
+        return self.date_interval.to_python()
 
 
 class ContinuousDatetimeInterval(Timepoint):
@@ -989,21 +992,15 @@ class ContinuousDatetimeInterval(Timepoint):
     year = YearDescriptor()
     allow_missing_year = AllowMissingYearDescriptor(True)
 
+    __slots__ = ('start_date', 'start_time', 'end_date', 'end_time')
+    _cmp_attrs = ('start_date', 'start_time', 'end_date', 'end_time')
+
     def __init__(self, start_date, start_time, end_date, end_time):
         self.start_date = start_date
         self.start_time = start_time
         self.end_date = end_date
         self.end_time = end_time
 
-    def __eq__(self, other):
-        if not super(ContinuousDatetimeInterval, self).__eq__(other):
-            return False
-        return (
-            self.start_date == other.start_date
-            and self.start_time == other.start_time
-            and self.end_date == other.end_date
-            and self.end_time == other.end_time)
-
     def __lt__(self, other):
         if self.start_date < other.start_date:
             return True
@@ -1063,49 +1060,63 @@ class ContinuousDatetimeInterval(Timepoint):
     @property
     def rrulestr(self):
         """Return the ContinuousDatetimeInterval RRule string."""
-        end_dt = datetime.combine(self.end_date.to_python(),  DAY_END)
+        return self._rrulestr(self.start_date.to_python())
+
+    def _rrulestr(self, start_date):
         return makerrulestr(
-            start=self.start_date.to_python(),
+            start=start_date,
             count=1,
             byhour=self.start_time.hour,
             byminute=self.start_time.minute)
 
     @property
     def duration(self):
+        return self._duration(
+            self.start_date.to_python(), self.end_date.to_python())
+
+    def _duration(self, start_date, end_date):
         start_datetime = datetime.combine(
-            self.start_date.to_python(), self.start_time.to_python())
+            start_date, self.start_time.to_python())
         end_datetime = datetime.combine(
-            self.end_date.to_python(), self.end_time.to_python())
+            end_date, self.end_time.to_python())
         return duration(start=start_datetime,
                         end=end_datetime)
 
     @add_span
     def export(self):
         """Export the ContinuousDatetimeInterval to a database-ready format."""
+        start_date = self.start_date.to_python()
+        end_date = self.end_date.to_python()
         return {
-            'rrule': self.rrulestr,
-            'duration': self.duration
+            'rrule': self._rrulestr(start_date),
+            'duration': self._duration(start_date, end_date)
         }
 
 
 class Weekdays(Timepoint):
 
-    def __init__(self, days, *args, **kwargs):
-        self.days = [d for d in ORDERED_DAYS if d in days]
+    """A set of weekdays, stored as a 7-bit mask (one bit per weekday,
+    monday being the lowest bit).
 
-    def __eq__(self, other):
-        if not super(Weekdays, self).__eq__(other):
-            return False
-        return sorted(str(d) for d in self.days) == sorted(str(d) for d in other.days)
+    """
+
+    __slots__ = ('days_mask',)
+    _cmp_attrs = ('days_mask',)
+
+    def __init__(self, days, *args, **kwargs):
+        self.days = days
 
     def __lt__(self, other):
-        return min(self.days) < min(other.days)
+        # the lowest bit set in the mask is the first weekday
+        return (
+            self.days_mask & -self.days_mask <
+            other.days_mask & -other.days_mask)
 
     def __hash__(self):
-        return hash(sorted(self.days))
+        return hash(self.days_mask)
 
     def __len__(self):
-        return len(self.days)
+        return bin(self.days_mask).count('1')
 
     def __iter__(self):
         return iter(self.days)
@@ -1116,9 +1127,21 @@ class Weekdays(Timepoint):
         else:
             return u', '.join(str(w) for w in self.days)
 
+    @property
+    def days(self):
+        """The ordered list of the weekdays in the mask."""
+        return [d for d in ORDERED_DAYS if self.days_mask & (1 << d.weekday)]
+
+    @days.setter
+    def days(self, days):
+        self.days_mask = 0
+        for day in days:
+            if day in ORDERED_DAYS:
+                self.days_mask |= 1 << day.weekday
+
     @property
     def all_week(self):
-        return [w.weekday for w in self.days] == list(range(0, 7))
+        return self.days_mask == ALL_WEEK_MASK
 
 
 class WeeklyRecurrence(Timepoint):
@@ -1126,20 +1149,15 @@ class WeeklyRecurrence(Timepoint):
     year = YearDescriptor()
     allow_missing_year = AllowMissingYearDescriptor(True)
 
+    __slots__ = ('date_interval', 'time_interval', 'weekdays', 'excluded')
+    _cmp_attrs = ('date_interval', 'time_interval', 'weekdays')
+
     def __init__(self, date_interval, time_interval, weekdays):
         self.date_interval = date_interval
         self.time_interval = time_interval
         self.weekdays = [d for d in ORDERED_DAYS if d in weekdays]
         self.excluded = []
 
-    def __eq__(self, other):
-        if not super(WeeklyRecurrence, self).__eq__(other):
-            return False
-        return (
-            self.date_interval == other.date_interval and
-            self.time_interval == other.time_interval and
-            self.weekdays == other.weekdays)
-
     def __lt__(self, other):
         first_self = next(iter(self.to_python()))
         first_other = next(iter(other.to_python()))
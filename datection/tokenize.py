@@ -9,13 +9,21 @@ from builtins import range
 from builtins import object
 from past.utils import old_div
 import re
+import sys
 import unicodedata
 
-from collections import Counter, defaultdict
+from collections import defaultdict
+from functools import lru_cache
 from datection.timepoint import NormalizationError
 from datection.context import probe, Context
+from datection.grammar import grammar_module
 from datection.utils import cached_property
 
+# Regexes compiled once at import time
+DIGIT_REGEX = re.compile(r"\d")
+REPETITION_REGEX = re.compile(r"(.{6,}?)\1+")
+COLON_SEPARATOR_REGEX = re.compile(r'\s?(:)\s')
+
 
 def get_repetitions(txt):
     """ Detect list of repetions in a text with statistics
@@ -31,11 +39,10 @@ def get_repetitions(txt):
             'context': Context,
           }
     """
-    r = re.compile(r"(.{6,}?)\1+")
-    tok_txt = re.sub(r"\d", 'X', txt).replace('\n', '')
+    tok_txt = DIGIT_REGEX.sub('X', txt).replace('\n', '')
 
     repetitions = []
-    for match in r.finditer(tok_txt):
+    for match in REPETITION_REGEX.finditer(tok_txt):
         idx_start = match.start()
         pattern = match.group(1)
         idx_end = match.end()
@@ -53,10 +60,52 @@ def get_repetitions(txt):
     return repetitions
 
 
+# Token actions. They are interned so that they can be compared by identity
+ACTION_MATCH = sys.intern('MATCH')
+ACTION_EXCLUDE = sys.intern('EXCLUDE')
+ACTION_IGNORE = sys.intern('IGNORE')
+ACTION_TEXT = sys.intern('TEXT')
+
+SEPARATOR_CLASSES = frozenset([
+    'Pd',  # Punctuation, dash
+    'Po',  # Punctuation, other
+    'Zs',  # Separator, space
+])
+
+# Lookup table of the Latin-1 code points (0-255), where SEPARATOR_LUT[i]
+# is 1 if chr(i) is a separator, 0 otherwise. It avoids calling
+# unicodedata.category on the most common characters (including no-break
+# spaces and inverted punctuation marks)
+SEPARATOR_LUT = bytes(bytearray(
+    1 if unicodedata.category(chr(i)) in SEPARATOR_CLASSES else 0
+    for i in range(256)))
+
+# Characters replaced by a whitespace when cleaning a context
+CONTEXT_TRANSLATION_TABLE = {ord(u'('): u' ', ord(u')'): u' '}
+
+
+@lru_cache(maxsize=None)
+def compiled_expressions(lang):
+    """Return the (compiled regex, translation) pairs of the replacement
+    expressions of the argument language.
+
+    The expressions are compiled once per language, instead of once per
+    searched context.
+
+    """
+    expressions = grammar_module(lang).EXPRESSIONS
+    return [
+        (re.compile(expression, flags=re.I), translation)
+        for expression, translation in expressions.items()
+    ]
+
+
 class Match(object):
 
     """A pattern match found in a text."""
 
+    __slots__ = ('timepoint', 'timepoint_type', 'start_index', 'end_index')
+
     def __init__(self, timepoint, timepoint_type, start_index, end_index):
         self.timepoint = timepoint
         self.timepoint_type = timepoint_type
@@ -64,6 +113,8 @@ class Match(object):
         self.end_index = end_index
 
     def __eq__(self, other):
+        if other is self:
+            return True
         return self.timepoint == other.timepoint
 
     @property
@@ -78,6 +129,10 @@ class Token(object):
 
     """A fragment of text, with a position, a tag and an action."""
 
+    __slots__ = (
+        'content', 'timepoint', 'tag', '_span', 'start', 'end', '_action',
+        'ignored', 'is_match', 'is_exclusion')
+
     def __init__(self, content, timepoint, tag, span, action):
         self.content = content
         self.timepoint = timepoint
@@ -94,24 +149,38 @@ class Token(object):
             self.end)
 
     @property
-    def start(self):
-        return self.span[0]
+    def action(self):
+        return self._action
 
-    @property
-    def end(self):
-        return self.span[1]
+    @action.setter
+    def action(self, action):
+        """Set the token action, along with the ignored, is_match and
+        is_exclusion flags, so that reading them is a plain attribute
+        access.
 
-    @property
-    def ignored(self):
-        return self.action in ['IGNORE', 'TEXT']
+        """
+        if isinstance(action, str):
+            action = sys.intern(action)
+        self._action = action
+        self.ignored = action is ACTION_IGNORE or action is ACTION_TEXT
+        self.is_match = action is ACTION_MATCH
+        self.is_exclusion = action is ACTION_EXCLUDE
 
     @property
-    def is_match(self):
-        return self.action == 'MATCH'
+    def span(self):
+        return self._span
 
-    @property
-    def is_exclusion(self):
-        return self.action == 'EXCLUDE'
+    @span.setter
+    def span(self, span):
+        """Set the token span, along with its start and end positions, so
+        that reading them is a plain attribute access.
+
+        """
+        self._span = span
+        if span is None:
+            self.start = self.end = None
+        else:
+            self.start, self.end = span
 
 
 class TokenGroup(object):
@@ -121,6 +190,8 @@ class TokenGroup(object):
 
     """
 
+    __slots__ = ('tokens',)
+
     def __init__(self, tokens):  # pragma:: no cover
         if isinstance(tokens, list):
             self.tokens = tokens
@@ -164,16 +235,23 @@ class Tokenizer(object):
     @cached_property
     def language_module(self):
         """The grammar module object related to the Tokenizer language."""
-        return __import__(
-            'datection.grammar.%s' % (self.lang),
-            fromlist=['grammar'])
+        return grammar_module(self.lang)
 
     @property
     def timepoint_patterns(self):  # pragma: no cover
         """The list of all time-related patterns in the Tokenizer language."""
         return self.language_module.TIMEPOINTS
 
-    @property
+    @cached_property
+    def non_weekly_timepoint_patterns(self):
+        """The list of time-related patterns, without the weekly recurrence
+        ones, shared by all the contexts in which no weekday was probed.
+
+        """
+        return [
+            tp for tp in self.timepoint_patterns if tp[0] != 'weekly_rec']
+
+    @cached_property
     def timepoint_patterns_hierarchy(self):
         """
         Dictionary of patterns complexities
@@ -213,47 +291,62 @@ class Tokenizer(object):
         Output: [(match4, 'time'), (match1, 'datetime')]
 
         """
-        def spanset(span):
-            return frozenset(list(range(span[0], span[1])))
-
-        matches = [(tpt, ctx, spanset(tpt.span)) for tpt, ctx in matches]
-        out = matches[:]  # shallow copy
-
-        # First, remove all timepoints which span set is a subset of
-        # other timepoints span set
-        for group1 in matches:
-            for group2 in matches:
-                if group1 is group2:
-                    continue
-                (tpt1, ctx1, span1), (tpt2, ctx2, span2) = group1, group2
-                if span1.intersection(span2):
-                    if span1 == span2:
-                        continue
-                    # if A ⊃ B or A = B: remove B
-                    elif span1.issuperset(span2) or span1 == span2:
-                        if (tpt2, ctx2, span2) in out:
-                            out.remove((tpt2, ctx2, span2))
-                    # if A ⊂ B: remove A
-                    elif span1.issubset(span2):
-                        if (tpt1, ctx1, span1) in out:
-                            out.remove((tpt1, ctx1, span1))
-
-        # Now, remove all timepoints which span set is intersecting with at
-        # least 2 other ones.
-        intersections = Counter()
-        for group1 in out:
-            for group2 in out:
-                if group1 is group2:
-                    continue
-                # Tolerate spans that are exactly the same (they do not really
-                # intersect)
+        # no subset nor intersection is possible with less than 2 matches
+        if len(matches) < 2:
+            return list(matches)
+
+        # read each match span only once
+        spans = [tpt.span for tpt, ctx in matches]
+
+        # First, remove all timepoints which span is strictly contained
+        # into another timepoint span. Spans are swept by increasing start
+        # and decreasing end: a span is contained into one of the spans
+        # preceding it iff it ends before the furthest end seen so far.
+        # Identical spans do not contain each other, and empty spans never
+        # overlap anything.
+        order = sorted(
+            (i for i, (start, end) in enumerate(spans) if start < end),
+            key=lambda i: (spans[i][0], -spans[i][1]))
+        contained = set()
+        max_end = -1
+        previous = None
+        previous_max_end = -1
+        for i in order:
+            span = spans[i]
+            if span != previous:
+                previous, previous_max_end = span, max_end
+            if span[1] <= previous_max_end:
+                contained.add(i)
+            if span[1] > max_end:
+                max_end = span[1]
+        out = [
+            (tpt, ctx, spans[i])
+            for i, (tpt, ctx) in enumerate(matches) if i not in contained]
+
+        # Now, remove all timepoints which span is intersecting with at
+        # least 2 other ones. Each pair is visited once, and the
+        # intersections are counted by position in the list.
+        n_out = len(out)
+        intersections = [0] * n_out
+        for i in range(n_out):
+            span1 = out[i][2]
+            start1, end1 = span1
+            # an empty span does not intersect anything
+            if start1 >= end1:
+                continue
+            for j in range(i + 1, n_out):
+                span2 = out[j][2]
+                # Tolerate spans that are exactly the same (they do not
+                # really intersect)
                 if span1 == span2:
                     continue
-                (tpt1, ctx1, span1), (tpt2, ctx2, span2) = group1, group2
-                if span1.intersection(span2):
-                    intersections[id(group1)] += 1
-        out = [(group[0], group[1])
-               for group in out if intersections[id(group)] < 2]
+                start2, end2 = span2
+                if start2 < end2 and start1 < end2 and start2 < end1:
+                    intersections[i] += 1
+                    intersections[j] += 1
+        out = [
+            (tpt, ctx) for (tpt, ctx, span), n_intersections
+            in zip(out, intersections) if n_intersections < 2]
 
         # sort list by match position
         out = sorted(out, key=lambda item: item[0].start_index)
@@ -264,13 +357,18 @@ class Tokenizer(object):
         """
         Removes simple patterns when more complex pattern with same span exists
         """
+        hierarchy = self.timepoint_patterns_hierarchy
+
         def exists_more_complex_match_with_same_span(match, matches):
             """ Checks if more complex pattern with same span exists """
+            if match.timepoint_type != 'weekly_rec':
+                return False
+            more_complex_types = hierarchy[match.timepoint_type]
+            start, end = match.start_index, match.end_index
             return any(
-                match.timepoint_type in ['weekly_rec'] and
-                match.start_index == other.start_index and
-                match.end_index == other.end_index and
-                other.timepoint_type in self.timepoint_patterns_hierarchy[match.timepoint_type]
+                start == other.start_index and
+                end == other.end_index and
+                other.timepoint_type in more_complex_types
                 for other, _ in matches
             )
 
@@ -289,13 +387,17 @@ class Tokenizer(object):
         to whitespaces as first and last characters.
 
         """
-        if text.find(' ') == -1:
+        if ' ' not in text:
             return start, end
-        new_text = text.lstrip()
-        new_start = start + (len(text) - len(new_text))
-        new_text = new_text.rstrip()
-        new_end = end - (len(text) - len(new_text))
-        return new_start, new_end
+        # count the leading and trailing whitespaces without copying the text
+        length = len(text)
+        i = 0
+        while i < length and text[i].isspace():
+            i += 1
+        j = length
+        while j > i and text[j - 1].isspace():
+            j -= 1
+        return start + i, end - (length - (j - i))
 
     @staticmethod
     def clean_context(ctx):
@@ -306,14 +408,13 @@ class Tokenizer(object):
         having being cleaned!
 
         """
-        ctx = re.sub('\n\n', '  ', ctx)
-        ctx = re.sub(
-            r'\s?(:)\s',
+        ctx = ctx.replace('\n\n', '  ')
+        ctx = COLON_SEPARATOR_REGEX.sub(
             lambda m: '   ' if m.group().startswith(' ') else '  ',
             ctx)
-        ctx = re.sub(r'\(', ' ', ctx)
-        ctx = re.sub(r'\)', ' ', ctx)
-        ctx = re.sub(r'\.\n', '. ', ctx)
+        # both parentheses are replaced in a single scan of the context
+        ctx = ctx.translate(CONTEXT_TRANSLATION_TABLE)
+        ctx = ctx.replace('.\n', '. ')
         return ctx
 
     @staticmethod
@@ -327,34 +428,39 @@ class Tokenizer(object):
         """
         if len(text) < 6:
             return True
-        separator_classes = [
-            'Pd',  # Punctuation, dash
-            'Po',  # Punctuation, other
-            'Zs',  # Separator, space
-        ]
-        return all(unicodedata.category(c) in separator_classes for c in text)
-
-    def search_context(self, context):
+        category = unicodedata.category
+        for c in text:
+            code_point = ord(c)
+            if code_point < 256:
+                if not SEPARATOR_LUT[code_point]:
+                    return False
+            elif category(c) not in SEPARATOR_CLASSES:
+                return False
+        return True
+
+    def search_context(self, context, matches=None):
         """Return all the non-overlapping time-related regex matches
         from the input textual context.
 
+        If a matches list is given, the context matches are appended to it,
+        which avoids allocating a list per context.
+
         """
-        matches = []
-        if six.PY2:
-            ctx = unicode(context)
-        else:
-            ctx = context.text[context.start: context.end]
+        if matches is None:
+            matches = []
+        ctx = context.text[context.start: context.end]
         ctx = self.clean_context(ctx)
 
         # replacement expression
-        for expression, translation in self.language_expressions.items():
-            ctx = re.sub(expression, translation, ctx, flags=re.I)
+        for expression, translation in compiled_expressions(self.lang):
+            ctx = expression.sub(translation, ctx)
 
         # if no weekday avoid weekday more complex pattern
         probe_kinds = self._update_probe_kinds(context.probe_kind, ctx)
-        timepoints = self.timepoint_patterns
-        if 'weekday' not in probe_kinds:
-            timepoints = [tp for tp in timepoints if tp[0] != 'weekly_rec']
+        if 'weekday' in probe_kinds:
+            timepoints = self.timepoint_patterns
+        else:
+            timepoints = self.non_weekly_timepoint_patterns
         n_timepoints = None
         analyse_subpattern = True
         pattern_list = None
@@ -370,7 +476,8 @@ class Tokenizer(object):
         dmatches = self._search_matches_timepoints(
             timepoints, context, ctx, analyse_subpattern, pattern_list
         )
-        matches = [t for mt in list(dmatches.values()) for t in mt]
+        for context_matches in dmatches.values():
+            matches.extend(context_matches)
         return matches
 
     def _extract_timepoint_from_patterns(self, ctx, timepoints):
@@ -390,6 +497,8 @@ class Tokenizer(object):
             self, timepoints, context, ctx, analyse_subpattern=True,
             pattern_list=None):
         """ Find all matches given a list of timepoint parse rules """
+        # stringify the context once for all the timepoints
+        ctx = str(ctx)
         dmatches = defaultdict(list)
         for tp in timepoints:
             mchs = self._search_matches_timepoint(tp, context, ctx)
@@ -414,8 +523,7 @@ class Tokenizer(object):
 
     def _update_probe_kinds(self, found_probe_kinds, new_text):
         """ Catch probe that was not found before replace"""
-        probes = __import__(
-            'datection.grammar.' + self.lang, fromlist=['grammar']).PROBES
+        probes = self.language_module.PROBES
         not_yet_found_probes = (prob for prob in probes if not any(
             pk == prob.resultsName for pk in found_probe_kinds))
 
@@ -473,19 +581,18 @@ class Tokenizer(object):
         pname = tp[0]
         pattern = tp[1]
         local_matches = []
-        ctx = str(ctx)
+        append = local_matches.append
+        trim_text = self.trim_text
         try:
             idx_offset = context.start
             for pattern_matches, start, end in pattern.scanString(ctx):
-                start, end = self.trim_text(ctx[start:end], start, end)
+                start, end = trim_text(ctx[start:end], start, end)
+                # position of the match in the original text, shared by all
+                # the timepoints parsed from it
+                start, end = idx_offset + start, idx_offset + end
                 for pattern_match in pattern_matches:
-                    match = Match(
-                        pattern_match,
-                        pname,
-                        idx_offset + start,
-                        idx_offset + end
-                    )
-                    local_matches.append((match, context))
+                    match = Match(pattern_match, pname, start, end)
+                    append((match, context))
 
         except NormalizationError:
             pass
@@ -495,14 +602,14 @@ class Tokenizer(object):
     # pragma: no cover
     def create_token(self, tag, text=None, match=None, span=None):
         if tag == 'exclusion':
-            action = 'EXCLUDE'
+            action = ACTION_EXCLUDE
         elif tag == 'sep':
             if self.is_separator(text):
-                action = 'IGNORE'
+                action = ACTION_IGNORE
             else:
-                action = 'TEXT'
+                action = ACTION_TEXT
         else:
-            action = 'MATCH'
+            action = ACTION_MATCH
         return Token(
             timepoint=match.timepoint,
             content=text,
@@ -513,17 +620,18 @@ class Tokenizer(object):
     def create_tokens(self, matches):
         """Create a list of tokens from a list of non overlapping matches."""
         tokens = []
-        start = 0
+        append = tokens.append
         for match, ctx in matches:
-            token = self.create_token(
-                match=match,
-                tag=match.timepoint_type,
-                text=ctx[match.start_index: match.end_index],
-                span=ctx.position_in_text(match.span)
-            )
-            sep_start, sep_end = ctx.position_in_text((start, token.start))
-            tokens.append(token)
-            start = token.end
+            # the matches are timepoints, never separators: the token action
+            # only depends on whether the timepoint is an exclusion
+            span = match.span
+            tag = match.timepoint_type
+            append(Token(
+                timepoint=match.timepoint,
+                content=ctx[span[0]: span[1]],
+                span=span,
+                tag=tag,
+                action=ACTION_EXCLUDE if tag == 'exclusion' else ACTION_MATCH))
         return tokens
 
     @staticmethod
@@ -534,28 +642,32 @@ class Tokenizer(object):
         separated by an EXCLUDE one.
 
         """
-        if [tok.action for tok in tokens] == ['EXCLUDE', 'MATCH']:
+        n_tokens = len(tokens)
+        if (n_tokens == 2 and tokens[0].action == ACTION_EXCLUDE
+                and tokens[1].action == ACTION_MATCH):
             return []
-        if len(tokens) < 3:
+        if n_tokens < 3:
             return [TokenGroup(tok) for tok in tokens]
         out = []
         i = 0
-        while i < len(tokens):
-            window = tokens[i: i + 3]
-            window_sep = [tok.action for tok in window]
-            if window_sep == ['MATCH', 'EXCLUDE', 'MATCH']:
-                token_group = TokenGroup(window)
+        while i < n_tokens:
+            token = tokens[i]
+            if (token.action == ACTION_MATCH
+                    and i + 2 < n_tokens
+                    and tokens[i + 1].action == ACTION_EXCLUDE
+                    and tokens[i + 2].action == ACTION_MATCH):
+                token_group = TokenGroup(tokens[i: i + 3])
                 i += 3
                 # the exlcusion potentially concerns multiple matches,
                 # keeps grouping as long as the matches have the same tag
-                excluded_tag = window[-1].tag
-                while (i < len(tokens)) and (tokens[i].tag == excluded_tag):
+                excluded_tag = tokens[i - 1].tag
+                while (i < n_tokens) and (tokens[i].tag == excluded_tag):
                     token_group.tokens.append(tokens[i])
                     i += 1
                 out.append(token_group)
             else:
-                if tokens[i].is_match:
-                    out.append(TokenGroup(tokens[i]))
+                if token.action == ACTION_MATCH:
+                    out.append(TokenGroup(token))
                 i += 1
         return out
 
@@ -570,7 +682,7 @@ class Tokenizer(object):
             return []
         matches = []
         for ctx in contexts:
-            matches.extend(self.search_context(ctx))
+            self.search_context(ctx, matches)
         non_overlapping_matches = self._remove_subsets(matches)
         most_complex_matches = self._remove_simpler_patterns(non_overlapping_matches)
         tokens = self.create_tokens(most_complex_matches)
@@ -7,10 +7,12 @@ from future.utils import viewitems
 
 from builtins import str
 from past.builtins import basestring
-from past.utils import old_div
 import re
 import datection
 
+from functools import lru_cache
+from itertools import groupby
+
 from datetime import datetime
 from datetime import date
 from datetime import time
@@ -25,6 +27,9 @@ UNLIMITED_DATETIME_END      = datetime(3000, 12, 31, 23, 59, 59)
 rrule_keywords = ['BYHOUR', 'BYMINUTE', 'BYDAY']
 regexp_keywords_equal_null = re.compile('|'.join(['%s=(;|$)' % keyword for keyword in rrule_keywords  ]))
 
+# translation table deleting the isoformat separators
+ISOFORMAT_DELETION_TABLE = str.maketrans('', '', '.:-')
+
 def get_current_date():
     """Return the current date.
 
@@ -34,23 +39,30 @@ def get_current_date():
     return date.today()
 
 
-def cached_property(f):
-    """Lazy loading decorator for object properties"""
-    attr_name = '_' + f.__name__
+class cached_property(object):
+    """Lazy loading decorator for object properties
+
+    The value is computed on first access and stored in the instance
+    __dict__ under the property name, which then shadows the decorator:
+    later accesses are plain attribute lookups.
+
+    """
+
+    def __init__(self, f):
+        self.f = f
+        self.__name__ = f.__name__
+        self.__doc__ = f.__doc__
 
-    @property
-    def wrapper(self):
-        if not hasattr(self, attr_name):
-            setattr(self, attr_name, f(self))
-        return getattr(self, attr_name)
-    return wrapper
+    def __get__(self, obj, cls):
+        if obj is None:
+            return self
+        value = obj.__dict__[self.__name__] = self.f(obj)
+        return value
 
 
 def isoformat_concat(datetime):
     """ Strip all dots, dashes and ":" from the input datetime isoformat """
-    isoformat = datetime.isoformat()
-    concat = re.sub(r'[\.:-]', '', isoformat)
-    return concat
+    return datetime.isoformat().translate(ISOFORMAT_DELETION_TABLE)
 
 
 def is_unlimited_start(start):
@@ -89,7 +101,7 @@ def cleanup_rrule_string(rrule_str):
     compatibility purpose with the non RFC form "DTSTART:\n" 
     """
     rrule_str = rrule_str.replace("DTSTART:\n", "")
-    rrule_str = re.sub(regexp_keywords_equal_null, '', rrule_str).strip(';')
+    rrule_str = regexp_keywords_equal_null.sub('', rrule_str).strip(';')
     return rrule_str
 
 
@@ -100,6 +112,22 @@ def makerrulestr(start, end=None, freq='DAILY', rule=None, **kwargs):
     be used to construct the rule. Else, the rrule RFC representation
     will be inserted.
 
+    """
+    if rule:
+        rule = stringify_rrule(rule)
+    return cached_makerrulestr(
+        start, end, freq, rule, tuple(sorted(kwargs.items())))
+
+
+@lru_cache(maxsize=2048, typed=True)
+def cached_makerrulestr(start, end, freq, rule, items):
+    """Memoized implementation of makerrulestr.
+
+    The same rules are generated over and over when exporting similar
+    schedules, so the results are cached on the (hashable) arguments.
+    The rule is expected to be already stringified, and the keyword args
+    are passed as a sorted tuple of (name, value) items.
+
     """
     # set a DTSTART if start date is empty or equal 01-01-0001
     dtstart = ''
@@ -113,19 +141,48 @@ def makerrulestr(start, end=None, freq='DAILY', rule=None, **kwargs):
         until = "UNTIL=%s" % isoformat_concat(end)
 
     if rule:
-        rulestr = stringify_rrule(rule) + ";"
-        rulestr = rulestr.replace('BYWEEKDAY', 'BYDAY')
+        rulestr = rule + ";"
+        if 'BYWEEKDAY' in rulestr:
+            rulestr = rulestr.replace('BYWEEKDAY', 'BYDAY')
     else:
-        rulestr = "RRULE:FREQ=%s;" % (freq)
-        for arg, val in sorted(kwargs.items()):
-            rulestr += arg.upper() + '=' + str(val) + ';'
+        parts = ["RRULE:FREQ=%s;" % (freq)]
+        parts.extend(
+            arg.upper() + '=' + str(val) + ';' for arg, val in items)
+        rulestr = ''.join(parts)
 
     if until and (rulestr.find('UNTIL') != -1):
         until = ''
 
-    result = '{start}{rule}{end}'.format(
-        start=dtstart, rule=rulestr, end=until)
-    return result.rstrip(';')
+    return (dtstart + rulestr + until).rstrip(';')
+
+
+def datetime_duration(start, end):
+    """Return the difference, in minutes, bewteen two datetimes"""
+    # truncated towards zero, for negative differences
+    return int((end - start).total_seconds() / 60)
+
+
+def time_duration(start, end):
+    """Return the difference, in minutes, bewteen two times
+
+    If the end time is before the start time, the difference wraps
+    around midnight.
+
+    """
+    seconds = (
+        (end.hour - start.hour) * 3600 +
+        (end.minute - start.minute) * 60 +
+        (end.second - start.second))
+    if end.microsecond < start.microsecond:
+        seconds -= 1
+    return (seconds % 86400) // 60
+
+
+# duration functions, indexed by the exact types of the start and end values
+DURATION_FUNCTIONS = {
+    (datetime, datetime): datetime_duration,
+    (time, time): time_duration,
+}
 
 
 def duration(start, end):
@@ -133,6 +190,11 @@ def duration(start, end):
     if end is None:
         return 0
 
+    # fast path for the most common types
+    duration_function = DURATION_FUNCTIONS.get((type(start), type(end)))
+    if duration_function is not None:
+        return duration_function(start, end)
+
     # convert datection.normalize.Time into datetime.time variables
     if (isinstance(start, datection.timepoint.Time)
        and isinstance(end, datection.timepoint.Time)):
@@ -141,14 +203,11 @@ def duration(start, end):
 
     # return the difference bewteen the end datetime and start datetime
     if isinstance(start, datetime) and isinstance(end, datetime):
-        return int(old_div((end - start).total_seconds(), 60))
+        return datetime_duration(start, end)
 
     # return the difference bewteen the two times
     if (isinstance(start, time) and isinstance(end, time)):
-        today = date.today()
-        start_dt = datetime.combine(today, start)
-        end_dt = datetime.combine(today, end)
-        return old_div((end_dt - start_dt).seconds, 60)
+        return time_duration(start, end)
 
 
 def normalize_2digit_year(year):
@@ -164,29 +223,29 @@ def normalize_2digit_year(year):
 
     """
     current_year = date.today().year
-    century = int(str(current_year)[:2])
+    century = current_year // 100
 
-    # handle special case where the 2 digit year started with a 0
-    # int("07") = 7
-    if len(str(year)) == 1:
-        year = '0' + str(year)
-    else:
-        year = str(year)
-    if int(str(century) + year) - current_year < 15:
+    # the year can either be an int or a 2 digit string ("07")
+    candidate = century * 100 + int(year)
+    if candidate - current_year < 15:
         # if year is less than 15 years in the future, it is considered
         # a future date
-        return int(str(century) + year)
+        return candidate
     else:
         # else, it is treated as a past date
-        return int(str(century - 1) + year)
+        return candidate - 100
 
 
 def digit_to_int(kwargs):
-    """Convert all digit values to integer and return the kwargs dict"""
+    """Convert all integer string values to integer and return the kwargs
+    dict"""
     for k, v in kwargs.items():
         if v and isinstance(v, basestring):
-            if v.isdigit():
+            # int() validates and converts the string in a single pass
+            try:
                 kwargs[k] = int(v)
+            except ValueError:
+                pass
     return kwargs
 
 WEEKDAY_IDX = {
@@ -229,57 +288,62 @@ def sort_facebook_hours(fb_hours):
     ]
 
     """
-    def facebook_hour_index(fb_hour_key):
-        wk_idx = WEEKDAY_IDX[fb_hour_key[:3]]
-        window_nb = fb_hour_key[4]
-        _open = 0 if fb_hour_key[6:] == 'open' else 1
-        idx = '%d%s%d' % (wk_idx, window_nb, _open)
-        return idx
+    def facebook_hour_index(fb_hour):
+        fb_hour_key = fb_hour[0]
+        # the window number can have more than one digit (ex: mon_10_open)
+        i = fb_hour_key.find('_')
+        j = fb_hour_key.find('_', i + 1)
+        wk_idx = WEEKDAY_IDX[fb_hour_key[:i]]
+        window_nb = int(fb_hour_key[i + 1:j])
+        _open = 0 if fb_hour_key[j + 1:] == 'open' else 1
+        return (wk_idx, window_nb, _open)
+
+    return sorted(fb_hours.items(), key=facebook_hour_index)
+
 
-    return sorted(list(fb_hours.items()), key=lambda x: facebook_hour_index(x[0]))
+def facebook_hour_window(fb_hour):
+    """Return the weekday and window number prefix (ex: 'mon_1') of a
+    facebook hours item"""
+    return fb_hour[0].rsplit('_', 1)[0]
 
 
 def group_facebook_hours(fb_hours):
-    out = []
-    previous = []
-    for i, fb_hour in enumerate(fb_hours):
-        if i == len(fb_hours) - 1:
-            previous.append(fb_hour)
-            out.append(previous)
-        elif fb_hour[0][:5] == fb_hours[i + 1][0][:5]:
-            previous.append(fb_hour)
-        else:
-            previous.append(fb_hour)
-            out.append(previous)
-            previous = []
-    return out
+    return [
+        list(group)
+        for _, group in groupby(fb_hours, key=facebook_hour_window)]
 
 
 def normalize_fb_hours(fb_hours):
     """Convert a Facebook opening hours dict to a recurrent schedule."""
 
-    def time_from_striptime(data):
-        t = datetime.strptime(data, "%H:%M").time()
-        return datection.timepoint.Time(t.hour, t.minute)
+    def time_from_fb_hour(data):
+        # facebook hours are formatted as HH:MM, no need for strptime
+        hour, minute = data.split(':')
+        return datection.timepoint.Time(int(hour), int(minute))
 
     # sort the dict items by the order of the weekdays
     fb_hours = sort_facebook_hours(fb_hours)
-    fb_hours = group_facebook_hours(fb_hours)
-    # iterate over each weekday, and create the associated recurrent schedule
+    # the recurrences are exported right away, so they can share the same
+    # undefined date interval
+    date_interval = datection.timepoint.DateInterval.make_undefined()
+    # iterate over each weekday window, and create the associated
+    # recurrent schedule, reading the opening and closing hours straight
+    # from the group iterator
     schedules = []
-    for fb_hour_group in fb_hours:
-        wk_idx = weekdays[WEEKDAY_IDX[fb_hour_group[0][0][:3]]]
-        opening_time = time_from_striptime(fb_hour_group[0][1])
+    for _, fb_hour_group in groupby(fb_hours, key=facebook_hour_window):
+        opening = next(fb_hour_group)
+        closing = next(fb_hour_group, None)
+        wk_idx = weekdays[WEEKDAY_IDX[opening[0][:3]]]
+        opening_time = time_from_fb_hour(opening[1])
+        closing_time = opening_time
+        if closing is not None:
+            closing_time = time_from_fb_hour(closing[1])
         time_interval = datection.timepoint.TimeInterval(
-            opening_time, opening_time)
-        if len(fb_hour_group) > 1:
-            closing_time = time_from_striptime(fb_hour_group[1][1])
-            time_interval = datection.timepoint.TimeInterval(
-                opening_time, closing_time)
+            opening_time, closing_time)
 
         reccurence = datection.timepoint.WeeklyRecurrence(
             weekdays=datection.timepoint.Weekdays([wk_idx]),
-            date_interval=datection.timepoint.DateInterval.make_undefined(),
+            date_interval=date_interval,
             time_interval=time_interval)
         db_format = reccurence.export()
         schedules.append(db_format)
@@ -56,14 +56,34 @@ class YearTransmitter(object):
         if not isinstance(yearless_timepoint, AbstractDate):
             return
 
+        target_dt = None
         for candidate in self.year_defined_timepoints:
             if isinstance(candidate, AbstractDateInterval):
                 dts = candidate.to_python()
-                target_dt = yearless_timepoint.to_python()
+                # the yearless timepoint is only converted once
+                if target_dt is None:
+                    target_dt = yearless_timepoint.to_python()
+                    month, day = target_dt.month, target_dt.day
                 for dt in dts:
-                    if dt.month == target_dt.month and dt.day == target_dt.day:
+                    if dt.month == month and dt.day == day:
                         return candidate
 
+    def candidate_index(self):
+        """Return a dict mapping each (month, day) couple to the first
+        timepoint that can transmit its year to a yearless timepoint
+        on that day, as candidate_container would.
+
+        Each candidate is thus only expanded once, instead of once per
+        yearless timepoint.
+
+        """
+        index = {}
+        for candidate in self.year_defined_timepoints:
+            if isinstance(candidate, AbstractDateInterval):
+                for dt in candidate.to_python():
+                    index.setdefault((dt.month, dt.day), candidate)
+        return index
+
     def transmit_year_to_exclusion(self, year, exclusion):
         """
         """
@@ -87,21 +107,37 @@ class YearTransmitter(object):
         inherit from the reference year, if defined.
 
         """
-        # First try to transmit the year from the appropriate timepoints
-        for yearless_timepoint in self.year_undefined_timepoints:
-            candidate = self.candidate_container(yearless_timepoint)
-            if candidate:
-                yearless_timepoint.year = candidate.year
+        # First try to transmit the year from the appropriate timepoints.
+        # Only dates can inherit a year, and the candidates are date
+        # intervals, so the candidates do not change during this round.
+        # The candidates are only indexed if there is a yearless date, as
+        # it requires expanding all the candidate intervals.
+        yearless_timepoints = self.year_undefined_timepoints
+        yearless_dates = [
+            t for t in yearless_timepoints if isinstance(t, AbstractDate)]
+        if yearless_dates:
+            candidates = self.candidate_index()
+            for yearless_date in yearless_dates:
+                target_dt = yearless_date.to_python()
+                candidate = candidates.get((target_dt.month, target_dt.day))
+                if candidate:
+                    yearless_date.year = candidate.year
 
         # After the first round of transmission, if there are some
         # yearless timepoints left, give them the reference year,
         # if defined
         if self.reference:
-            for yearless_timepoint in self.year_undefined_timepoints:
-                yearless_timepoint.year = self.reference.year
+            # only the timepoints which were yearless before the first round
+            # can still be yearless
+            yearless_timepoints = [
+                t for t in yearless_timepoints if not t.year]
+            reference_year = self.reference.year
+            transmit_year_to_exclusion = self.transmit_year_to_exclusion
+            for yearless_timepoint in yearless_timepoints:
+                yearless_timepoint.year = reference_year
                 if hasattr(yearless_timepoint, 'excluded'):
                     yearless_timepoint.excluded = [
-                        self.transmit_year_to_exclusion(self.reference.year, exclusion)
+                        transmit_year_to_exclusion(reference_year, exclusion)
                         for exclusion in yearless_timepoint.excluded
                     ]
 
@@ -3,7 +3,6 @@ from __future__ import division
 from builtins import next
 from builtins import str
 from builtins import range
-from past.utils import old_div
 from entities.mongo.activity import Activity
 import requests
 import frogress
@@ -14,16 +13,29 @@ from random import random
 # acts = Activity.objects(place = str(place.id))
 
 errors = 0
+session = None
+
+
+def init_worker():
+    """Open a single HTTP session per worker process, so that the
+    connection to the web service is kept alive between activities."""
+    global session
+    session = requests.Session()
+
 
 def activity_refresh(id):
     random_server = int(random()*2)+1 # choose between 1 et 2
     random_server=2 # c3po'+str(random_server)+'.
-    ret=requests.put('http://ws.mapado.com:8000/v2/merge/'+str(id)+'/refresh', params={'fields': 'schedule', 'persist': 1}, headers={'Accept-Language': 'fr'})
+    try:
+        ret=session.put('http://ws.mapado.com:8000/v2/merge/'+str(id)+'/refresh', params={'fields': 'schedule', 'persist': 1}, headers={'Accept-Language': 'fr'})
+    except Exception as e:
+        # an exception raised in a worker would stop the whole run
+        return id, "{} : {}\n".format(id, repr(e))
     if ret.status_code != 200:
         return_status = "{} : {} : {}\n".format(id, ret.status_code, ret.text)
     else:
         return_status = "{} : {}\n".format(id, ret.status_code)
-    return return_status
+    return id, return_status
 
 def cb_job_done(result):
     global errors
@@ -31,7 +43,6 @@ def cb_job_done(result):
     # if not ret.ok:
     #     errors+=1
     f.write(result)
-    f.flush()
     next(progress)
 
 
@@ -64,26 +75,44 @@ if num_to_recalculate > max_to_recalculate:
 
 progress = frogress.bar(list(range(num_to_recalculate)))
 
-p = Pool(24)
 
-for step in range(0, old_div(num_to_recalculate,batch_size)):
+def activity_ids():
+    """Yield the ids of the activities to recalculate.
+
+    A single cursor is used, fetching only the activity ids from the
+    database, batch_size documents at a time.
+
+    """
     acts = Activity.objects(
-		id__gte=last_id,
+        id__gte=last_id,
         **query_args
-		).order_by('_id').no_cache()[:batch_size]
-    #print "get ids"
-    #ids = [str(act.id) for act in acts]
-    #print "END"
-
-    results = []
-    for act in acts:
-        r=p.apply_async(activity_refresh, (str(act.id),), callback=cb_job_done)
-        results.append(r)
-        last_id = act.id
-    for r in results:
-        r.wait()
-
-
-f.close()
-print(errors)
-print("Last item ID : {}".format(last_id))
+    ).order_by('_id').only('id').no_cache().batch_size(batch_size)
+    for act in acts.limit(num_to_recalculate):
+        yield str(act.id)
+
+
+p = Pool(24, initializer=init_worker)
+
+try:
+    # stream the ids to the workers and handle the results as they come.
+    # The pool queues all the ids at once, but imap returns the results in
+    # the order of the ids: all the activities up to the last handled one
+    # are done, which makes it a safe resume point.
+    results = p.imap(activity_refresh, activity_ids(), chunksize=16)
+    for n, (act_id, result) in enumerate(results, 1):
+        cb_job_done(result)
+        last_id = act_id
+        # flush the log regularly, so that it can be followed during the run
+        if n % 100 == 0:
+            f.flush()
+except BaseException:
+    # do not wait for the queued activities, their results would be lost
+    p.terminate()
+    raise
+else:
+    p.close()
+finally:
+    p.join()
+    f.close()
+    print(errors)
+    print("Last item ID : {}".format(last_id))
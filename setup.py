@@ -8,6 +8,7 @@ setup(
     author_email=['balthazar@mapado.com'],
     packages=find_packages(),
     include_package_data=True,
+    python_requires='>=3',
     install_requires=[
         # private packages
         # public packages